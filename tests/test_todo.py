@@ -1,9 +1,10 @@
 """Tests for todo CLI manager."""
 
-import tempfile
+import json
 from pathlib import Path
 import pytest
-from todo import TodoItem, TodoManager
+import todo
+from todo import TodoItem, TodoManager, main
 
 
 class TestTodoItem:
@@ -16,12 +17,43 @@ class TestTodoItem:
         assert todo.category == "work"
         assert not todo.completed
 
+    def test_priority_normalized(self):
+        todo = TodoItem("Test", priority="HIGH", category="Work")
+        assert todo.priority == "high"
+        assert todo.category == "work"
+        todo.priority = "Low"
+        assert todo.priority == "low"
+        assert todo.to_dict()["priority"] == "low"
+        todo.priority = "Some" + "day"
+        assert todo.priority is TodoItem("Other", priority="someday").priority
+
+    def test_todo_has_no_instance_dict(self):
+        todo = TodoItem("Test")
+        assert not hasattr(todo, "__dict__")
+        with pytest.raises(AttributeError):
+            todo.notes = "extra"
+
+    def test_todo_str(self):
+        todo = TodoItem("Test", priority="high", due_date="2025-01-01", id=3)
+        assert str(todo) == "○ [3] 🔴 Test (due: 2025-01-01) [general]"
+        todo.priority = "someday"
+        assert "⚪" in str(todo)
+
     def test_todo_to_dict(self):
         todo = TodoItem("Test", id=1)
         data = todo.to_dict()
         assert data["title"] == "Test"
         assert data["id"] == 1
 
+    def test_to_dict_cache_invalidated(self):
+        todo = TodoItem("Test", id=1)
+        assert todo.to_dict() is todo.to_dict()
+        todo.completed = True
+        todo.mark_dirty()
+        assert todo.to_dict()["completed"] is True
+        todo.priority = "high"
+        assert todo.to_dict()["priority"] == "high"
+
     def test_todo_from_dict(self):
         data = {
             "id": 1,
@@ -41,13 +73,11 @@ class TestTodoManager:
     """Test TodoManager class."""
 
     @pytest.fixture
-    def temp_manager(self):
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
-            f.write("[]")
-            temp_path = f.name
-        manager = TodoManager(temp_path)
-        yield manager
-        Path(temp_path).unlink(missing_ok=True)
+    def temp_manager(self, tmp_path):
+        # tmp_path also collects the journal file written next to the store
+        temp_path = tmp_path / "todos.json"
+        temp_path.write_text("[]")
+        return TodoManager(str(temp_path))
 
     def test_add_todo(self, temp_manager):
         todo = temp_manager.add("New task", priority="high")
@@ -88,6 +118,8 @@ class TestTodoManager:
         assert stats["completed"] == 1
         assert stats["pending"] == 1
         assert stats["by_priority"]["low"] == 1
+        assert stats["by_priority"]["high"] == 0
+        assert stats["by_category"] == {"general": 1}
 
     def test_filter_by_category(self, temp_manager):
         temp_manager.add("Work task", category="work")
@@ -95,3 +127,356 @@ class TestTodoManager:
         work_todos = temp_manager.list(category="work")
         assert len(work_todos) == 1
         assert work_todos[0].category == "work"
+
+    def test_missing_id_returns_false(self, temp_manager):
+        temp_manager.add("Task")
+        assert not temp_manager.complete(99)
+        assert not temp_manager.uncomplete(99)
+        assert not temp_manager.edit(99, title="Nope")
+        assert not temp_manager.delete(99)
+
+    def test_clear_completed_drops_lookup(self, temp_manager):
+        temp_manager.add("Task 1")
+        temp_manager.add("Task 2")
+        temp_manager.complete(1)
+        assert temp_manager.clear_completed() == 1
+        assert not temp_manager.complete(1)
+        assert temp_manager.complete(2)
+
+    def test_save_and_reload(self, temp_manager):
+        temp_manager.add("Persisted", priority="high", due_date="2025-12-25")
+        temp_manager.flush()
+        reloaded = TodoManager(str(temp_manager.data_file))
+        assert len(reloaded.todos) == 1
+        assert reloaded.todos[0].title == "Persisted"
+        assert reloaded.todos[0].due_date == "2025-12-25"
+        assert reloaded.next_id == 2
+
+    def test_mutations_batched_until_flush(self, temp_manager):
+        temp_manager.add("Task 1")
+        temp_manager.add("Task 2")
+        assert temp_manager.data_file.read_text() == "[]"
+        temp_manager.flush()
+        assert len(TodoManager(str(temp_manager.data_file)).todos) == 2
+
+    def test_context_manager_flushes(self, temp_manager):
+        with TodoManager(str(temp_manager.data_file)) as manager:
+            manager.add("Task")
+        assert len(TodoManager(str(temp_manager.data_file)).todos) == 1
+
+    def test_list_sorted_by_priority_then_due(self, temp_manager):
+        temp_manager.add("Low", priority="low")
+        temp_manager.add("High later", priority="high", due_date="2025-12-31")
+        temp_manager.add("High sooner", priority="high", due_date="2025-01-01")
+        temp_manager.add("Medium")
+        titles = [t.title for t in temp_manager.list()]
+        assert titles == ["High sooner", "High later", "Medium", "Low"]
+        temp_manager.edit(1, priority="high")
+        assert temp_manager.list()[2].title == "Low"
+
+    def test_sorted_on_first_ordered_access(self, temp_manager):
+        temp_manager.data_file.write_text(json.dumps([
+            TodoItem("Low", priority="low", id=1).to_dict(),
+            TodoItem("High", priority="high", id=2).to_dict(),
+        ]))
+        manager = TodoManager(str(temp_manager.data_file))
+        assert manager.complete(1)
+        assert manager.stats()["pending"] == 1
+        assert manager._sorted_keys is None
+        assert [t.title for t in manager.list(show_all=True)] == ["High", "Low"]
+        manager.add("Medium")
+        assert [t.title for t in manager.todos] == ["High", "Medium", "Low"]
+
+    def test_uncomplete_returns_to_pending(self, temp_manager):
+        temp_manager.add("Task 1")
+        temp_manager.add("Task 2")
+        temp_manager.complete(1)
+        assert temp_manager.uncomplete(1)
+        assert len(temp_manager.list()) == 2
+        temp_manager.complete(2)
+        temp_manager.delete(2)
+        stats = temp_manager.stats()
+        assert stats["total"] == 1
+        assert stats["completed"] == 0
+        assert stats["pending"] == 1
+
+    def test_filter_by_category_and_priority(self, temp_manager):
+        temp_manager.add("Work high", priority="high", category="work")
+        temp_manager.add("Work low", priority="low", category="Work")
+        temp_manager.add("Home high", priority="high", category="home")
+        temp_manager.complete(1)
+        assert temp_manager.list(category="work", priority="high") == []
+        both = temp_manager.list(show_all=True, category="WORK", priority="high")
+        assert [t.id for t in both] == [1]
+        temp_manager.edit(3, category="work")
+        assert [t.id for t in temp_manager.list(category="work")] == [3, 2]
+        assert temp_manager.list(category="home") == []
+        temp_manager.delete(2)
+        assert temp_manager.list(priority="low") == []
+
+    def test_todos_kept_sorted(self, temp_manager):
+        temp_manager.add("Low", priority="low")
+        temp_manager.add("High", priority="high")
+        temp_manager.add("Medium due", due_date="2025-06-01")
+        assert [t.id for t in temp_manager.todos] == [2, 3, 1]
+        temp_manager.edit(3, due_date="")
+        temp_manager.edit(1, priority="high", due_date="2025-01-01")
+        assert [t.id for t in temp_manager.todos] == [1, 2, 3]
+        temp_manager.delete(2)
+        assert [t.id for t in temp_manager.list(show_all=True)] == [1, 3]
+
+    def test_direct_field_change_is_saved(self, temp_manager):
+        todo = temp_manager.add("Task")
+        temp_manager.save()
+        todo.title = "Renamed"
+        todo.mark_dirty()
+        temp_manager.save()
+        assert TodoManager(str(temp_manager.data_file)).todos[0].title == "Renamed"
+
+    def test_delete_after_direct_field_change(self, temp_manager):
+        a = temp_manager.add("a", priority="low")
+        temp_manager.add("b", priority="medium")
+        temp_manager.add("c", priority="high")
+        a.priority = "high"
+        assert temp_manager.delete(a.id)
+        assert [t.title for t in temp_manager.todos] == ["c", "b"]
+        assert temp_manager.edit(3, due_date="2025-01-01")
+        assert [t.title for t in temp_manager.list()] == ["c", "b"]
+
+    def test_filter_after_direct_field_change(self, temp_manager):
+        a = temp_manager.add("a", category="work")
+        a.category = "home"
+        assert temp_manager.delete(a.id)
+        assert temp_manager.list(show_all=True, category="work") == []
+
+    def test_filter_after_mutations_before_first_filter(self, temp_manager):
+        a = temp_manager.add("a", category="work")
+        b = temp_manager.add("b", category="home", priority="high")
+        temp_manager.edit(a.id, category="home")
+        temp_manager.delete(b.id)
+        assert temp_manager.list(category="home") == [a]
+        temp_manager.edit(a.id, priority="low")
+        assert temp_manager.list(category="home", priority="medium") == []
+        assert temp_manager.list(priority="low") == [a]
+
+    def test_save_compact_and_export_pretty(self, temp_manager, tmp_path):
+        temp_manager.add("Task")
+        temp_manager.save()
+        assert "\n" not in temp_manager.data_file.read_text()
+        assert not Path(str(temp_manager.data_file) + ".tmp").exists()
+        export_file = tmp_path / "export.json"
+        temp_manager.export(str(export_file))
+        assert '\n  {\n    "id": 1,' in export_file.read_text()
+
+    def test_edits_reach_saved_file(self, temp_manager):
+        temp_manager.add("Task")
+        temp_manager.save()
+        temp_manager.edit(1, title="Renamed", due_date="2025-02-02")
+        temp_manager.complete(1)
+        temp_manager.flush()
+        todo = TodoManager(str(temp_manager.data_file)).todos[0]
+        assert todo.title == "Renamed"
+        assert todo.due_date == "2025-02-02"
+        assert todo.completed
+
+    def test_add_appends_to_journal_without_loading(self, temp_manager):
+        temp_manager.add("Task 1")
+        temp_manager.flush()
+        store = temp_manager.data_file.read_bytes()
+
+        manager = TodoManager(str(temp_manager.data_file))
+        todo = manager.add("Task 2")
+        assert todo.id == 2
+        assert not manager._loaded
+        assert temp_manager.data_file.read_bytes() == store
+
+        reloaded = TodoManager(str(temp_manager.data_file))
+        assert [t.title for t in reloaded.todos] == ["Task 1", "Task 2"]
+        assert reloaded.next_id == 3
+
+    def test_journal_not_shared_between_stores_with_same_stem(self, tmp_path):
+        TodoManager(str(tmp_path / "a.json")).save()
+        TodoManager(str(tmp_path / "a.bak")).save()
+        TodoManager(str(tmp_path / "a.json")).add("Task")
+        assert TodoManager(str(tmp_path / "a.bak")).todos == []
+        assert [t.title for t in TodoManager(str(tmp_path / "a.json")).todos] == ["Task"]
+
+    def test_journaled_todo_is_adopted_on_load(self, temp_manager):
+        temp_manager.add("a")
+        temp_manager.flush()
+        with TodoManager(str(temp_manager.data_file)) as manager:
+            todo = manager.add("b")
+            todo.title = "x"
+            todo.mark_dirty()
+        assert [t.title for t in TodoManager(str(temp_manager.data_file)).todos] == ["a", "x"]
+
+        with TodoManager(str(temp_manager.data_file)) as manager:
+            todo = manager.add("c")
+            assert todo in manager.todos
+            todo.title = "y"
+            todo.mark_dirty()
+        assert [t.title for t in TodoManager(str(temp_manager.data_file)).todos] == ["a", "x", "y"]
+
+    def test_journal_compacted_on_save(self, temp_manager):
+        temp_manager.add("Task 1")
+        temp_manager.flush()
+        manager = TodoManager(str(temp_manager.data_file))
+        manager.JOURNAL_COMPACT_AT = 1
+        manager.add("Task 2")
+        manager.add("Task 3")
+        assert manager._loaded
+        manager.flush()
+        assert len(temp_manager.journal_file.read_bytes().splitlines()) == 1
+        assert [t.id for t in TodoManager(str(temp_manager.data_file)).todos] == [1, 2, 3]
+
+    def test_only_first_add_is_journaled(self, temp_manager):
+        temp_manager.add("Task 1")
+        temp_manager.flush()
+        with TodoManager(str(temp_manager.data_file)) as manager:
+            manager.add("Task 2")
+            assert not manager._loaded
+            manager.add("Task 3")
+            assert manager._loaded
+            assert len(temp_manager.journal_file.read_bytes().splitlines()) == 2
+        assert [t.id for t in TodoManager(str(temp_manager.data_file)).todos] == [1, 2, 3]
+        assert len(temp_manager.journal_file.read_bytes().splitlines()) == 1
+
+    def test_stats_numpy_matches_python(self, temp_manager):
+        pytest.importorskip("numpy")
+        for i in range(30):
+            temp_manager.add(
+                f"Task {i}",
+                priority=("high", "medium", "low")[i % 3],
+                category=("work", "home")[i % 2],
+            )
+        temp_manager.add("Odd", priority="urgent")
+        for i in range(1, 31, 4):
+            temp_manager.complete(i)
+        expected = temp_manager.stats()
+        temp_manager.NUMPY_MIN_ITEMS = 0
+        assert temp_manager.stats() == expected
+        temp_manager.uncomplete(1)
+        temp_manager.edit(2, category="garden")
+        numpy_stats = temp_manager.stats()
+        temp_manager.NUMPY_MIN_ITEMS = 10_000
+        assert numpy_stats == temp_manager.stats()
+
+    def test_stats_numpy_after_reorder(self, temp_manager):
+        pytest.importorskip("numpy")
+        temp_manager.NUMPY_MIN_ITEMS = 0
+        temp_manager.add("a", priority="urgent", due_date="2025-01-01")
+        temp_manager.add("b", priority="someday", due_date="2025-06-01")
+        temp_manager.complete(1)
+        temp_manager.stats()
+        temp_manager.edit(1, due_date="2030-01-01")
+        assert temp_manager.stats()["by_priority"]["someday"] == 1
+        assert "urgent" not in temp_manager.stats()["by_priority"]
+
+    def test_stats_numpy_columns_follow_mutations(self, temp_manager):
+        pytest.importorskip("numpy")
+        temp_manager.NUMPY_MIN_ITEMS = 0
+        temp_manager.stats()
+        assert temp_manager.stats()["by_category"] == {}
+        temp_manager.add("a", category="work")
+        temp_manager.add("b", priority="urgent")
+        temp_manager.stats()
+        temp_manager.add("c", priority="high", category="home")
+        temp_manager.complete(1)
+        temp_manager.delete(2)
+        temp_manager.edit(3, priority="low")
+        numpy_stats = temp_manager.stats()
+        assert numpy_stats["by_category"] == {"home": 1}
+        temp_manager.NUMPY_MIN_ITEMS = 10_000
+        assert numpy_stats == temp_manager.stats()
+
+    def test_noop_changes_do_not_mark_dirty(self, temp_manager):
+        temp_manager.add("Task", priority="high", category="work")
+        temp_manager.complete(1)
+        temp_manager.save()
+        assert temp_manager.edit(1, title="Task", priority="HIGH", category="Work")
+        assert temp_manager.complete(1)
+        assert not temp_manager._dirty
+        assert temp_manager.uncomplete(1)
+        assert temp_manager._dirty
+
+    def test_journal_add_after_torn_append(self, temp_manager):
+        temp_manager.add("a")
+        temp_manager.flush()
+        with open(temp_manager.journal_file, "ab") as f:
+            f.write(b'{"id":2,"ti')
+        assert TodoManager(str(temp_manager.data_file)).add("b").id == 2
+        assert TodoManager(str(temp_manager.data_file)).add("c").id == 3
+        reloaded = TodoManager(str(temp_manager.data_file))
+        assert [t.title for t in reloaded.todos] == ["a", "b", "c"]
+
+    def test_journal_add_after_unterminated_append(self, temp_manager):
+        temp_manager.add("a")
+        temp_manager.flush()
+        with open(temp_manager.journal_file, "ab") as f:
+            f.write(json.dumps(TodoItem("b", id=2).to_dict()).encode())
+        assert TodoManager(str(temp_manager.data_file)).add("c").id == 3
+        reloaded = TodoManager(str(temp_manager.data_file))
+        assert [t.title for t in reloaded.todos] == ["a", "b", "c"]
+
+    def test_journal_add_survives_crash_during_save(self, temp_manager, monkeypatch):
+        temp_manager.add("a")
+        temp_manager.flush()
+        temp_manager.add("b")
+        write_atomic = todo._write_atomic
+
+        def crash_before_journal_reset(path, data):
+            if path == temp_manager.journal_file:
+                raise OSError("crash")
+            write_atomic(path, data)
+
+        monkeypatch.setattr("todo._write_atomic", crash_before_journal_reset)
+        with pytest.raises(OSError):
+            temp_manager.save()
+        monkeypatch.undo()
+
+        assert TodoManager(str(temp_manager.data_file)).add("c").id == 3
+        reloaded = TodoManager(str(temp_manager.data_file))
+        assert sorted(t.title for t in reloaded.todos) == ["a", "b", "c"]
+
+        reloaded.delete(2)
+        reloaded.save()
+        assert [t.id for t in TodoManager(str(temp_manager.data_file)).todos] == [1, 3]
+
+    def test_store_keeps_next_id_after_delete(self, temp_manager):
+        temp_manager.add("Task 1")
+        temp_manager.add("Task 2")
+        temp_manager.delete(2)
+        temp_manager.flush()
+        reloaded = TodoManager(str(temp_manager.data_file))
+        assert [t.id for t in reloaded.todos] == [1]
+        assert reloaded.add("Task 3").id == 3
+
+    def test_load_migrates_list_store(self, tmp_path):
+        data_file = tmp_path / "todos.json"
+        data_file.write_text(
+            '[{"id": 4, "title": "Old", "priority": "low", "due_date": null,'
+            ' "category": "general", "completed": false, "created_at": "2025-01-01T00:00:00"}]'
+        )
+        with TodoManager(str(data_file)) as manager:
+            assert manager.next_id == 5
+        data = json.loads(data_file.read_text())
+        assert data["next_id"] == 5
+        assert [item["id"] for item in data["todos"]] == [4]
+
+
+class TestCli:
+    """Test the command-line entry point."""
+
+    def run(self, monkeypatch, *argv):
+        monkeypatch.setattr("sys.argv", ["todo.py", *argv])
+        main()
+
+    def test_list_output(self, monkeypatch, tmp_path, capsys):
+        monkeypatch.chdir(tmp_path)
+        self.run(monkeypatch, "add", "Low task", "--priority", "low")
+        self.run(monkeypatch, "add", "High task", "--priority", "high")
+        capsys.readouterr()
+        self.run(monkeypatch, "list")
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[4:6] == ["○ [2] 🔴 High task [general]", "○ [1] 🟢 Low task [general]"]
+        assert lines[7] == "Showing 2 item(s)"
@@ -4,16 +4,91 @@ Command-Line Todo List Manager
 A full-featured CLI todo app with priorities, due dates, and categories.
 """
 
+import gc
 import json
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Set, Tuple
 import argparse
+import bisect
+from array import array
+from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _dumps(obj, pretty: bool = False) -> bytes:
+    """Serialize to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _import_numpy():
+    """Import numpy on first use so other commands don't pay for it."""
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - optional speedup
+        return None
+    return numpy
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Write data to a temp file, fsync it, then atomically replace path."""
+    tmp_file = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_file, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, path)
+
+
+# Priority name -> (sort rank, interned name); unknown priorities sort last.
+_PRIORITY_INTERN = {"high": (0, "high"), "medium": (1, "medium"), "low": (2, "low")}
+# Emoji indexed by priority rank
+_PRIORITY_EMOJI = ("🔴", "🟡", "🟢", "⚪")
+
+
+def _priority_rank(priority: str) -> Tuple[int, str]:
+    """Return (sort rank, interned lowercase name) for a priority."""
+    priority = priority.lower()
+    known = _PRIORITY_INTERN.get(priority)
+    return known if known is not None else (3, sys.intern(priority))
 
 
 class TodoItem:
-    """Represents a single todo item."""
+    """Represents a single todo item.
+
+    to_dict() is cached. TodoManager clears the cache when it changes an
+    item; after assigning to a field directly, call mark_dirty() so the
+    change reaches the next save.
+    """
+
+    __slots__ = (
+        "id",
+        "title",
+        "_priority",
+        "_priority_rank",
+        "due_date",
+        "category",
+        "completed",
+        "created_at",
+        "_cached_dict",
+    )
 
     def __init__(
         self,
@@ -25,25 +100,45 @@ class TodoItem:
         created_at: Optional[str] = None,
         id: Optional[int] = None,
     ):
+        self._cached_dict: Optional[Dict] = None
         self.id = id
         self.title = title
-        self.priority = priority.lower()
+        self._priority_rank, self._priority = _priority_rank(priority)
         self.due_date = due_date
-        self.category = category.lower()
+        self.category = sys.intern(category.lower())
         self.completed = completed
         self.created_at = created_at or datetime.now().isoformat()
 
+    @property
+    def priority(self) -> str:
+        """Lowercase priority name; setting it also updates the sort rank."""
+        return self._priority
+
+    @priority.setter
+    def priority(self, value: str):
+        self._priority_rank, self._priority = _priority_rank(value)
+        self._cached_dict = None
+
+    def mark_dirty(self):
+        """Drop the cached to_dict() result; call after changing any field."""
+        self._cached_dict = None
+
     def to_dict(self) -> Dict:
-        """Convert to dictionary for JSON storage."""
-        return {
-            "id": self.id,
-            "title": self.title,
-            "priority": self.priority,
-            "due_date": self.due_date,
-            "category": self.category,
-            "completed": self.completed,
-            "created_at": self.created_at,
-        }
+        """Convert to dictionary for JSON storage.
+
+        The dict is cached until mark_dirty() is called, so treat it as read-only.
+        """
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "id": self.id,
+                "title": self.title,
+                "priority": self.priority,
+                "due_date": self.due_date,
+                "category": self.category,
+                "completed": self.completed,
+                "created_at": self.created_at,
+            }
+        return self._cached_dict
 
     @classmethod
     def from_dict(cls, data: Dict) -> "TodoItem":
@@ -52,35 +147,365 @@ class TodoItem:
 
     def __str__(self) -> str:
         status = "✓" if self.completed else "○"
-        priority_emoji = {"high": "🔴", "medium": "🟡", "low": "🟢"}.get(self.priority, "⚪")
+        priority_emoji = _PRIORITY_EMOJI[self._priority_rank]
         due = f" (due: {self.due_date})" if self.due_date else ""
         return f"{status} [{self.id}] {priority_emoji} {self.title}{due} [{self.category}]"
 
 
+def _sort_key(todo: TodoItem) -> Tuple[int, str, int]:
+    """Sort by priority, then due date, then creation order."""
+    return (todo._priority_rank, todo.due_date or "9999-99-99", todo.id)
+
+
 class TodoManager:
-    """Manages todo items storage and operations."""
+    """Manages todo items storage and operations.
+
+    Mutations are kept in memory and written out by flush(). Use the manager
+    as a context manager to flush automatically on exit.
 
-    PRIORITY_ORDER = {"high": 0, "medium": 1, "low": 2}
+    The store is loaded lazily on first use. The first add() on a manager
+    that has not loaded yet appends to a small journal file next to the store
+    instead of reading it; later adds load the store and are batched like
+    any other change. The journal is replayed on load, reusing the instance
+    the journaled add() returned, and compacted into the store on save.
+
+    Each save bumps a generation number written to both the store and the
+    journal. Journal lines are {"generation", "next_id"} headers, each followed
+    by the todos added on top of that generation; load() replays only todos
+    whose generation is not older than the store's.
+    """
+
+    JOURNAL_COMPACT_AT = 100
+    NUMPY_MIN_ITEMS = 10_000
 
     def __init__(self, data_file: str = "todos.json"):
         self.data_file = Path(data_file)
-        self.todos: List[TodoItem] = []
-        self.next_id = 1
-        self.load()
+        # Keep the store's suffix so a.json and a.bak get separate journals
+        self.journal_file = self.data_file.with_suffix(self.data_file.suffix + ".journal")
+        self._loaded = False
+        # Todo returned by a journaled add(), adopted by load() so later
+        # changes to it are kept
+        self._journaled: Optional[TodoItem] = None
+        self._journaled_dict: Optional[Dict] = None
+        self._todos: List[TodoItem] = []
+        # Sort key of each item in self._todos, or None while self._todos is
+        # still in file order; sorted on the first access that needs the order
+        self._sorted_keys: Optional[List[Tuple[int, str, int]]] = []
+        # Key each todo was inserted under, in case its fields change afterwards;
+        # built from _sorted_keys on first delete/edit
+        self._key_by_id: Optional[Dict[int, Tuple[int, str, int]]] = None
+        self._by_id: Dict[int, TodoItem] = {}
+        self._pending: Dict[int, TodoItem] = {}
+        self._completed: Dict[int, TodoItem] = {}
+        # Category/priority buckets, built on the first filtered list()
+        self._by_category: Optional[Dict[str, Set[int]]] = None
+        self._by_priority: Optional[Dict[str, Set[int]]] = None
+        # (category, priority) buckets each todo was indexed under
+        self._bucket_by_id: Dict[int, Tuple[str, str]] = {}
+        # Columns for numpy stats(), one row per todo in the order rows were
+        # added. Built on first use and kept in sync by the mutators; deleted
+        # todos keep their row with the pending flag cleared.
+        self._row_by_id: Optional[Dict[int, int]] = None
+        self._row_todos: List[TodoItem] = []
+        self._col_pending = array("b")
+        self._col_rank = array("b")
+        self._col_category = array("i")
+        self._cat_to_idx: Dict[str, int] = {}
+        self._stats_calls = 0
+        self._next_id = 1
+        self._generation = 0
+        self._dirty = False
+
+    def __enter__(self) -> "TodoManager":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+
+    @property
+    def todos(self) -> List[TodoItem]:
+        """All todo items, sorted by priority then due date."""
+        self._ensure_loaded()
+        self._ensure_sorted()
+        return self._todos
+
+    @property
+    def next_id(self) -> int:
+        """Id that the next added todo will get."""
+        self._ensure_loaded()
+        return self._next_id
+
+    def _ensure_loaded(self):
+        """Load the store on first use."""
+        if not self._loaded:
+            self.load()
 
     def load(self):
-        """Load todos from JSON file."""
+        """Load todos from JSON file and replay the journal on top.
+
+        The store is {"generation": ..., "next_id": ..., "todos": [...]}. Older
+        stores holding a bare list are migrated to that format on the next save.
+        """
+        # Loading allocates a TodoItem and a dict per todo, none of them in
+        # cycles, so collector passes over them while loading are wasted work
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self._load()
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def _load(self):
+        """Body of load(), run with the garbage collector paused."""
+        todos: List[TodoItem] = []
+        next_id = 1
+        store_generation = 0
         if self.data_file.exists():
-            with open(self.data_file, "r") as f:
-                data = json.load(f)
-                self.todos = [TodoItem.from_dict(item) for item in data]
-                if self.todos:
-                    self.next_id = max(todo.id for todo in self.todos) + 1
+            data = _loads(self.data_file.read_bytes())
+            if isinstance(data, list):
+                data = {"todos": data}
+                self._dirty = True
+            todos = [TodoItem.from_dict(item) for item in data["todos"]]
+            store_generation = data.get("generation", 0)
+            if "next_id" in data:
+                next_id = data["next_id"]
+            elif todos:
+                next_id = max(todo.id for todo in todos) + 1
+        generation = segment = store_generation
+        for entry in self._read_journal() or ():
+            if "id" not in entry:
+                segment = entry.get("generation", 0)
+                generation = max(generation, segment)
+                next_id = max(next_id, entry["next_id"])
+            elif segment >= store_generation:
+                # Older segments were already compacted into the store
+                todos.append(TodoItem.from_dict(entry))
+                next_id = max(next_id, entry["id"] + 1)
+        journaled = self._journaled
+        if journaled is not None:
+            # Swap in the instance add() returned (appended last) and treat it
+            # as an unsaved add, so later changes to it are saved too
+            for i in range(len(todos) - 1, -1, -1):
+                if todos[i].id == journaled.id:
+                    todos[i] = journaled
+                    self._dirty = True
+                    break
+        self._todos = todos
+        self._next_id = next_id
+        self._generation = generation
+        self._loaded = True
+        self._rebuild_index()
+
+    def _read_journal(self, repair: bool = False) -> Optional[List[Dict]]:
+        """Return the journal's headers and added todos, or None if there is none.
+
+        With repair=True, a torn final append is cut off (or a complete final
+        line missing its newline is terminated) so the next append starts on
+        a fresh line.
+        """
+        try:
+            data = self.journal_file.read_bytes()
+        except FileNotFoundError:
+            return None
+        lines = data.splitlines()
+        entries = []
+        for i, line in enumerate(lines):
+            if not line.strip():
+                continue
+            try:
+                entries.append(_loads(line))
+            except ValueError:
+                # A torn final append is dropped; anything earlier is real corruption
+                if i != len(lines) - 1:
+                    raise
+                if repair:
+                    os.truncate(self.journal_file, data.rindex(line))
+                    return entries or None
+        if repair and data and not data.endswith(b"\n"):
+            self._append_journal(b"\n")
+        return entries or None
+
+    def _journal_add(self, todo: TodoItem) -> bool:
+        """Append a new todo to the journal without loading the store.
+
+        Returns False when there is no journal yet or it is due for compaction,
+        in which case the caller should load the store and add normally.
+        """
+        entries = self._read_journal(repair=True)
+        if entries is None or len(entries) > self.JOURNAL_COMPACT_AT:
+            return False
+        next_id = 1
+        for entry in entries:
+            if "id" in entry:
+                next_id = max(next_id, entry["id"] + 1)
+            else:
+                next_id = max(next_id, entry["next_id"])
+        todo.id = next_id
+        self._append_journal(_dumps(todo.to_dict()) + b"\n")
+        return True
+
+    def _append_journal(self, line: bytes):
+        """Append one line to the journal and fsync it."""
+        with open(self.journal_file, "ab") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _rebuild_index(self):
+        """Rebuild the lookup tables from self._todos.
+
+        Only the tables every command needs are built here; sorting, the
+        category and priority buckets and _key_by_id wait for first use.
+        """
+        todos = self._todos
+        self._sorted_keys = None
+        self._key_by_id = None
+        self._by_id = {todo.id: todo for todo in todos}
+        self._pending = {todo.id: todo for todo in todos if not todo.completed}
+        self._completed = {todo.id: todo for todo in todos if todo.completed}
+        self._by_category = None
+        self._by_priority = None
+        self._bucket_by_id = {}
+        self._row_by_id = None
+
+    def _ensure_sorted(self):
+        """Sort self._todos into list() order on first use."""
+        if self._sorted_keys is not None:
+            return
+        # Compute each sort key once, then sort on it
+        keyed = sorted(zip(map(_sort_key, self._todos), self._todos), key=itemgetter(0))
+        self._sorted_keys = [key for key, _ in keyed]
+        self._todos = [todo for _, todo in keyed]
+
+    def _ensure_buckets(self):
+        """Build the category/priority buckets on first use."""
+        if self._by_category is not None:
+            return
+        self._by_category = {}
+        self._by_priority = {}
+        for todo in self._todos:
+            self._bucket(todo)
+
+    def _bucket(self, todo: TodoItem):
+        """Add a todo to the category/priority buckets."""
+        self._by_category.setdefault(todo.category, set()).add(todo.id)
+        self._by_priority.setdefault(todo.priority, set()).add(todo.id)
+        self._bucket_by_id[todo.id] = (todo.category, todo.priority)
+
+    def _index(self, todo: TodoItem):
+        """Add a todo to the lookup tables."""
+        self._by_id[todo.id] = todo
+        if todo.completed:
+            self._completed[todo.id] = todo
+        else:
+            self._pending[todo.id] = todo
+        if self._by_category is not None:
+            self._bucket(todo)
+        if self._row_by_id is not None:
+            self._add_row(todo)
+
+    def _unindex(self, todo: TodoItem):
+        """Remove a todo from the lookup tables."""
+        self._by_id.pop(todo.id, None)
+        self._pending.pop(todo.id, None)
+        self._completed.pop(todo.id, None)
+        if self._row_by_id is not None:
+            self._col_pending[self._row_by_id.pop(todo.id)] = False
+        if self._by_category is None:
+            return
+        category, priority = self._bucket_by_id.pop(todo.id)
+        for table, key in ((self._by_category, category), (self._by_priority, priority)):
+            ids = table.get(key)
+            if ids is not None:
+                ids.discard(todo.id)
+                if not ids:
+                    del table[key]
+
+    def _keys_by_id(self) -> Dict[int, Tuple[int, str, int]]:
+        """Map each id to its key in _sorted_keys, building the map on first use."""
+        if self._key_by_id is None:
+            self._ensure_sorted()
+            # The id is the last element of every key
+            self._key_by_id = {key[2]: key for key in self._sorted_keys}
+        return self._key_by_id
+
+    def _insert_sorted(self, todo: TodoItem):
+        """Insert a todo into self.todos, keeping it in list() order."""
+        self._ensure_sorted()
+        key = _sort_key(todo)
+        i = bisect.bisect_left(self._sorted_keys, key)
+        self._sorted_keys.insert(i, key)
+        self._todos.insert(i, todo)
+        if self._key_by_id is not None:
+            self._key_by_id[todo.id] = key
+
+    def _remove_sorted(self, todo: TodoItem):
+        """Remove a todo from self.todos using the key it was inserted under."""
+        key = self._keys_by_id().pop(todo.id)
+        i = bisect.bisect_left(self._sorted_keys, key)
+        del self._sorted_keys[i]
+        del self._todos[i]
+
+    def _build_columns(self):
+        """Build the stats() columns from self._todos."""
+        todos = self._todos
+        self._row_todos = list(todos)
+        self._row_by_id = {todo.id: row for row, todo in enumerate(todos)}
+        self._col_pending = array("b", [not todo.completed for todo in todos])
+        self._col_rank = array("b", [todo._priority_rank for todo in todos])
+        self._cat_to_idx = cat_to_idx = {}
+        self._col_category = array(
+            "i", [cat_to_idx.setdefault(todo.category, len(cat_to_idx)) for todo in todos]
+        )
+
+    def _add_row(self, todo: TodoItem):
+        """Append a todo to the stats() columns."""
+        self._row_by_id[todo.id] = len(self._row_todos)
+        self._row_todos.append(todo)
+        self._col_pending.append(not todo.completed)
+        self._col_rank.append(todo._priority_rank)
+        self._col_category.append(
+            self._cat_to_idx.setdefault(todo.category, len(self._cat_to_idx))
+        )
 
     def save(self):
-        """Save todos to JSON file."""
-        with open(self.data_file, "w") as f:
-            json.dump([todo.to_dict() for todo in self.todos], f, indent=2)
+        """Save todos to JSON file as compact JSON, replacing it atomically.
+
+        This also compacts the journal down to a header for the new generation.
+        """
+        self._ensure_loaded()
+        generation = self._generation + 1
+        header = _dumps({"generation": generation, "next_id": self._next_id}) + b"\n"
+        # Announce the new generation in the journal first, so adds journaled
+        # after a crash between the two writes below are not taken as compacted
+        self._append_journal(header)
+        data = {
+            "generation": generation,
+            "next_id": self._next_id,
+            "todos": [todo.to_dict() for todo in self._todos],
+        }
+        _write_atomic(self.data_file, _dumps(data))
+        _write_atomic(self.journal_file, header)
+        self._generation = generation
+        self._dirty = False
+
+    def export(self, path: str):
+        """Write todos to path as indented, human-readable JSON."""
+        Path(path).write_bytes(_dumps([todo.to_dict() for todo in self.todos], pretty=True))
+
+    def flush(self):
+        """Save todos if anything changed since the last save."""
+        if self._dirty or self._journaled_changed():
+            self.save()
+
+    def _journaled_changed(self) -> bool:
+        """Whether the journaled todo was changed before the store was loaded."""
+        return (
+            not self._loaded
+            and self._journaled is not None
+            and self._journaled.to_dict() != self._journaled_dict
+        )
 
     def add(
         self,
@@ -95,11 +520,18 @@ class TodoManager:
             priority=priority,
             due_date=due_date,
             category=category,
-            id=self.next_id,
         )
-        self.todos.append(todo)
-        self.next_id += 1
-        self.save()
+        if not self._loaded and self._journaled is None and self._journal_add(todo):
+            # One journaled add keeps single CLI adds cheap; batches load instead
+            self._journaled = todo
+            self._journaled_dict = dict(todo.to_dict())
+            return todo
+        self._ensure_loaded()
+        todo.id = self._next_id
+        self._insert_sorted(todo)
+        self._index(todo)
+        self._next_id += 1
+        self._dirty = True
         return todo
 
     def list(
@@ -108,49 +540,81 @@ class TodoManager:
         category: Optional[str] = None,
         priority: Optional[str] = None,
     ) -> List[TodoItem]:
-        """List todo items with optional filtering."""
-        todos = self.todos if show_all else [t for t in self.todos if not t.completed]
-
-        if category:
-            todos = [t for t in todos if t.category == category.lower()]
-        if priority:
-            todos = [t for t in todos if t.priority == priority.lower()]
-
-        # Sort by priority, then due date
-        todos.sort(
-            key=lambda t: (
-                self.PRIORITY_ORDER.get(t.priority, 3),
-                t.due_date or "9999-99-99",
-            )
-        )
+        """List todo items with optional filtering, sorted by priority then due date."""
+        self._ensure_loaded()
+        # Interned keys let the bucket lookups match stored keys by identity
+        category = sys.intern(category.lower()) if category else None
+        priority = sys.intern(priority.lower()) if priority else None
+
+        # Pick the cheapest source for this filter combination up front so the
+        # per-item work below has no None checks or unused predicates
+        if category or priority:
+            self._ensure_buckets()
+        if category and priority:
+            category_ids = self._by_category.get(category, set())
+            ids = category_ids & self._by_priority.get(priority, set())
+        elif category:
+            ids = self._by_category.get(category, set())
+        elif priority:
+            ids = self._by_priority.get(priority, set())
+        else:
+            # self._todos is kept sorted once sorted, so no sort is needed here
+            self._ensure_sorted()
+            if show_all:
+                return list(self._todos)
+            return [t for t in self._todos if not t.completed]
+
+        if show_all:
+            by_id = self._by_id
+            todos = [by_id[i] for i in ids]
+        else:
+            pending = self._pending
+            todos = [pending[i] for i in ids if i in pending]
+        todos.sort(key=_sort_key)
         return todos
 
     def complete(self, todo_id: int) -> bool:
         """Mark a todo as completed."""
-        for todo in self.todos:
-            if todo.id == todo_id:
-                todo.completed = True
-                self.save()
-                return True
-        return False
+        self._ensure_loaded()
+        todo = self._by_id.get(todo_id)
+        if todo is None:
+            return False
+        if todo.completed:
+            return True
+        todo.completed = True
+        todo.mark_dirty()
+        if self._row_by_id is not None:
+            self._col_pending[self._row_by_id[todo_id]] = False
+        self._completed[todo_id] = self._pending.pop(todo_id, todo)
+        self._dirty = True
+        return True
 
     def uncomplete(self, todo_id: int) -> bool:
         """Mark a todo as not completed."""
-        for todo in self.todos:
-            if todo.id == todo_id:
-                todo.completed = False
-                self.save()
-                return True
-        return False
+        self._ensure_loaded()
+        todo = self._by_id.get(todo_id)
+        if todo is None:
+            return False
+        if not todo.completed:
+            return True
+        todo.completed = False
+        todo.mark_dirty()
+        if self._row_by_id is not None:
+            self._col_pending[self._row_by_id[todo_id]] = True
+        self._pending[todo_id] = self._completed.pop(todo_id, todo)
+        self._dirty = True
+        return True
 
     def delete(self, todo_id: int) -> bool:
         """Delete a todo item."""
-        for i, todo in enumerate(self.todos):
-            if todo.id == todo_id:
-                del self.todos[i]
-                self.save()
-                return True
-        return False
+        self._ensure_loaded()
+        todo = self._by_id.get(todo_id)
+        if todo is None:
+            return False
+        self._remove_sorted(todo)
+        self._unindex(todo)
+        self._dirty = True
+        return True
 
     def edit(
         self,
@@ -161,30 +625,59 @@ class TodoManager:
         category: Optional[str] = None,
     ) -> bool:
         """Edit a todo item."""
-        for todo in self.todos:
-            if todo.id == todo_id:
-                if title:
-                    todo.title = title
-                if priority:
-                    todo.priority = priority.lower()
-                if due_date is not None:
-                    todo.due_date = due_date
-                if category:
-                    todo.category = category.lower()
-                self.save()
-                return True
-        return False
+        self._ensure_loaded()
+        todo = self._by_id.get(todo_id)
+        if todo is None:
+            return False
+        priority = sys.intern(priority.lower()) if priority else None
+        category = sys.intern(category.lower()) if category else None
+        retitle = bool(title) and title != todo.title
+        redate = due_date is not None and due_date != todo.due_date
+        rebucket = (priority and priority != todo.priority) or (
+            category and category != todo.category
+        )
+        if not (retitle or redate or rebucket):
+            # Nothing actually changed, so there is nothing to save
+            return True
+
+        todo.mark_dirty()
+        if retitle:
+            todo.title = title
+        if redate:
+            todo.due_date = due_date
+        if rebucket:
+            # Re-bucket the todo under its new priority/category
+            self._unindex(todo)
+            if priority:
+                todo.priority = priority
+            if category:
+                todo.category = category
+            self._index(todo)
+        if _sort_key(todo) != self._keys_by_id()[todo.id]:
+            self._remove_sorted(todo)
+            self._insert_sorted(todo)
+        self._dirty = True
+        return True
 
     def stats(self) -> Dict:
         """Get todo statistics."""
-        total = len(self.todos)
-        completed = sum(1 for t in self.todos if t.completed)
-        pending = total - completed
-        by_priority = {"high": 0, "medium": 0, "low": 0}
-        by_category: Dict[str, int] = {}
-
-        for todo in self.todos:
-            if not todo.completed:
+        self._ensure_loaded()
+        total = len(self._todos)
+        completed = len(self._completed)
+        pending = len(self._pending)
+        # A one-shot command would spend more importing numpy and building the
+        # columns than the loop costs, so numpy starts with the second call
+        self._stats_calls += 1
+        repeated = self._stats_calls > 1
+        np = _import_numpy() if repeated and total >= self.NUMPY_MIN_ITEMS else None
+        if np is not None:
+            by_priority, by_category = self._pending_counts_numpy(np)
+        else:
+            by_priority = {"high": 0, "medium": 0, "low": 0}
+            by_category: Dict[str, int] = {}
+
+            # Single pass over pending items only
+            for todo in self._pending.values():
                 by_priority[todo.priority] = by_priority.get(todo.priority, 0) + 1
                 by_category[todo.category] = by_category.get(todo.category, 0) + 1
 
@@ -196,13 +689,39 @@ class TodoManager:
             "by_category": by_category,
         }
 
+    def _pending_counts_numpy(self, np) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """Count pending todos by priority and category over the numpy columns.
+
+        The columns are built on the first call and then updated in place by
+        the mutators, so later calls only pay for the bincounts.
+        """
+        if self._row_by_id is None:
+            self._build_columns()
+        pending = np.frombuffer(self._col_pending, dtype=np.bool_)
+        ranks = np.frombuffer(self._col_rank, dtype=np.int8)
+        categories = np.frombuffer(self._col_category, dtype=np.intc)
+        cat_table = list(self._cat_to_idx)
+        rank_counts = np.bincount(ranks[pending], minlength=4)
+        category_counts = np.bincount(categories[pending], minlength=len(cat_table))
+        by_priority = {
+            name: int(rank_counts[rank]) for name, (rank, _) in _PRIORITY_INTERN.items()
+        }
+        if rank_counts[3]:
+            # Unknown priorities share rank 3, so count those few by name
+            for i in np.flatnonzero(pending & (ranks == 3)):
+                name = self._row_todos[i].priority
+                by_priority[name] = by_priority.get(name, 0) + 1
+        by_category = {cat: int(c) for cat, c in zip(cat_table, category_counts) if c}
+        return by_priority, by_category
+
     def clear_completed(self) -> int:
         """Remove all completed todos. Returns count removed."""
-        original_count = len(self.todos)
-        self.todos = [t for t in self.todos if not t.completed]
-        removed = original_count - len(self.todos)
+        self._ensure_loaded()
+        removed = len(self._completed)
         if removed > 0:
-            self.save()
+            self._todos = [t for t in self._todos if not t.completed]
+            self._rebuild_index()
+            self._dirty = True
         return removed
 
 
@@ -219,6 +738,7 @@ Examples:
   %(prog)s done 1
   %(prog)s delete 1
   %(prog)s stats
+  %(prog)s export todos-pretty.json
         """,
     )
 
@@ -275,6 +795,10 @@ Examples:
     # Clear command
     subparsers.add_parser("clear", help="Remove all completed todos")
 
+    # Export command
+    export_parser = subparsers.add_parser("export", help="Export todos as readable JSON")
+    export_parser.add_argument("output", help="Output file path")
+
     return parser
 
 
@@ -288,7 +812,7 @@ def print_stats(stats: Dict):
     print(f"Pending:        {stats['pending']}")
     print("\nBy Priority (pending):")
     for priority, count in stats["by_priority"].items():
-        emoji = {"high": "🔴", "medium": "🟡", "low": "🟢"}.get(priority, "⚪")
+        emoji = _PRIORITY_EMOJI[_PRIORITY_INTERN.get(priority, (3,))[0]]
         print(f"{emoji} {priority.capitalize()}: {count}")
     if stats["by_category"]:
         print("\nBy Category (pending):")
@@ -306,8 +830,12 @@ def main():
         parser.print_help()
         sys.exit(1)
 
-    manager = TodoManager()
+    with TodoManager() as manager:
+        run_command(args, manager)
 
+
+def run_command(args: argparse.Namespace, manager: TodoManager):
+    """Run the parsed CLI command against the manager."""
     if args.command == "add":
         todo = manager.add(
             title=args.title,
@@ -331,8 +859,8 @@ def main():
             print(f"\n{'=' * 50}")
             print(f"TODO LIST{' (including completed)' if args.all else ''}")
             print(f"{'=' * 50}")
-            for todo in todos:
-                print(todo)
+            # One write for the whole list instead of a print() per item
+            sys.stdout.write("\n".join(map(str, todos)) + "\n")
             print(f"{'=' * 50}")
             print(f"Showing {len(todos)} item(s)\n")
 
@@ -377,6 +905,10 @@ def main():
         count = manager.clear_completed()
         print(f"✓ Cleared {count} completed todo(s)")
 
+    elif args.command == "export":
+        manager.export(args.output)
+        print(f"✓ Exported {len(manager.todos)} todo(s) to {args.output}")
+
 
 if __name__ == "__main__":
     main()